@@ -490,6 +490,7 @@ class OpenstackCompute(object):
                         self.timeout_sleep(intf.isUp, 1)
                         if port.mac_address is not None:
                             intf.setMAC(port.mac_address)
+                            c.invalidateNetworkStatusCache()
                         else:
                             port.mac_address = intf.MAC()
                         port.assigned_container = c
@@ -136,7 +136,7 @@ class OpenstackManage(object):
             # set a dpid for the switch. for this we have to get the id of the
             # next possible dc
             self.floating_switch = self.net.addSwitch(
-                "fs1", dpid=hex(first_dc._get_next_dc_dpid())[2:])
+                "fs1", dpid="%x" % first_dc._get_next_dc_dpid())
             # this is the interface appearing on the physical host
             self.floating_root = Node('root', inNamespace=False)
             self.net.hosts.append(self.floating_root)
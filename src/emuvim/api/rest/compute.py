@@ -156,14 +156,14 @@ class ComputeList(Resource):
                 # return list with all compute nodes in all DCs
                 all_containers = []
                 for dc in dcs.values():
-                    all_containers += dc.listCompute()
+                    all_containers += dc.listComputeSnapshot()
                 container_list = [(c.name, c.getStatus())
                                   for c in all_containers]
                 return container_list, 200, CORS_HEADER
             else:
                 # return list of compute nodes for specified DC
                 container_list = [(c.name, c.getStatus())
-                                  for c in dcs.get(dc_label).listCompute()]
+                                  for c in dcs.get(dc_label).listComputeSnapshot()]
                 return container_list, 200, CORS_HEADER
         except Exception as ex:
             logging.exception("API error.")
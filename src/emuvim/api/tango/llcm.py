@@ -519,6 +519,7 @@ class Service(object):
             intf = vnfi.intf(intf=if_name)
             if intf is not None:
                 intf.setIP(net_str)
+                vnfi.invalidateNetworkStatusCache()
                 LOG.debug("Reconfigured network of %s:%s to %r" %
                           (vnfi.name, if_name, net_str))
             else:
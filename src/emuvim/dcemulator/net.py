@@ -29,6 +29,7 @@ import re
 import requests
 import os
 import json
+import threading
 import networkx as nx
 from subprocess import Popen
 # from gevent import monkey
@@ -46,7 +47,6 @@ from emuvim.dcemulator.resourcemodel import ResourceModelRegistrar
 
 # setup logging
 LOG = logging.getLogger("dcemulator.net")
-LOG.setLevel(logging.DEBUG)
 
 # default CPU period used for cpu percentage-based cfs values (microseconds)
 CPU_PERIOD = 1000000
@@ -88,6 +88,11 @@ class DCNetwork(Containernet):
         self.deployed_elines = []
         self.deployed_elans = []
         self.installed_chains = []
+        # index of all compute instances in all data centers (name -> node)
+        self.container_index = {}
+        # protects the index and network setup of compute instances
+        # that are started concurrently (see Datacenter.startComputeMany)
+        self.container_lock = threading.Lock()
 
         # always cleanup environment before we start the emulator
         self.killRyu()
@@ -147,7 +152,7 @@ class DCNetwork(Containernet):
         dc.net = self  # set reference to network
         self.dcs[label] = dc
         dc.create()  # finally create the data center in our Mininet instance
-        LOG.info("added data center: %s" % label)
+        LOG.info("added data center: %s", label)
         return dc
 
     def addLink(self, node1, node2, **params):
@@ -189,6 +194,7 @@ class DCNetwork(Containernet):
             params["cls"] = TCLink
 
         link = Containernet.addLink(self, node1, node2, **params)
+        self._invalidateNetworkStatus(node1, node2)
 
         # try to give container interfaces a default id
         node1_port_id = node1.ports[link.intf1]
@@ -236,8 +242,8 @@ class DCNetwork(Containernet):
         self.DCNetwork_graph.add_edge(
             node2.name, node1.name, **attr_dict2)
 
-        LOG.debug("addLink: n1={0} intf1={1} -- n2={2} intf2={3}".format(
-            str(node1), node1_port_name, str(node2), node2_port_name))
+        LOG.debug("addLink: n1=%s intf1=%s -- n2=%s intf2=%s",
+                  node1, node1_port_name, node2, node2_port_name)
 
         return link
 
@@ -251,17 +257,28 @@ class DCNetwork(Containernet):
         assert node1 is not None
         assert node2 is not None
         Containernet.removeLink(self, link=link, node1=node1, node2=node2)
+        self._invalidateNetworkStatus(node1, node2)
         # TODO we might decrease the loglevel to debug:
         try:
             self.DCNetwork_graph.remove_edge(node2.name, node1.name)
         except BaseException:
-            LOG.warning("%s, %s not found in DCNetwork_graph." %
-                        ((node2.name, node1.name)))
+            LOG.warning("%s, %s not found in DCNetwork_graph.",
+                        node2.name, node1.name)
         try:
             self.DCNetwork_graph.remove_edge(node1.name, node2.name)
         except BaseException:
-            LOG.warning("%s, %s not found in DCNetwork_graph." %
-                        ((node1.name, node2.name)))
+            LOG.warning("%s, %s not found in DCNetwork_graph.",
+                        node1.name, node2.name)
+
+    @staticmethod
+    def _invalidateNetworkStatus(*nodes):
+        """
+        Ensure that cached network status of the given
+        compute instances is refreshed after link changes.
+        """
+        for n in nodes:
+            if isinstance(n, EmulatorCompute):
+                n.invalidateNetworkStatusCache()
 
     def addDocker(self, label, **params):
         """
@@ -278,6 +295,18 @@ class DCNetwork(Containernet):
         self.DCNetwork_graph.remove_node(label)
         return Containernet.removeDocker(self, label, **params)
 
+    def removeCompute(self, d, switch):
+        """
+        Remove a compute instance together with all its links to the
+        given (data center) switch. The links still have to be removed
+        explicitly to clean up the switch side (OVS ports, Mininet
+        bookkeeping), but their graph edges are dropped together with
+        the node.
+        """
+        for link in self.linksBetween(d, switch):
+            Containernet.removeLink(self, link=link)
+        return self.removeDocker(d.name)
+
     def addExtSAP(self, sap_name, sap_ip, **params):
         """
         Wrapper for addExtSAP method to store SAP  also in graph.
@@ -319,10 +348,10 @@ class DCNetwork(Containernet):
         """
         Returns a list with all containers within all data centers.
         """
-        all_containers = []
-        for dc in self.dcs.values():
-            all_containers += dc.listCompute()
-        return all_containers
+        # skip names reserved by containers that are still being created
+        # (list() takes a snapshot, the index may change concurrently)
+        return [c for c in list(self.container_index.values())
+                if c is not None]
 
     def start(self):
         # start
@@ -332,6 +361,10 @@ class DCNetwork(Containernet):
 
     def stop(self):
 
+        # stop data centers
+        for dc in self.dcs.values():
+            dc.stop()
+
         # stop the monitor agent
         if self.monitor_agent is not None:
             self.monitor_agent.stop()
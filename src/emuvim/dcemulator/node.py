@@ -26,16 +26,26 @@
 from mininet.node import Docker
 from mininet.link import Link
 from emuvim.dcemulator.resourcemodel import NotEnoughResourcesAvailable
+import itertools
 import logging
+import time
 
 
 LOG = logging.getLogger("dcemulator.node")
-LOG.setLevel(logging.DEBUG)
 
 
 DCDPID_BASE = 1000  # start of switch dpid's used for data center switches
 EXTSAPDPID_BASE = 2000  # start of switch dpid's used for external SAP switches
 
+# atomic counters to generate the switch dpid's
+_DCDPID_ITER = itertools.count(DCDPID_BASE + 1)
+_EXTSAPDPID_ITER = itertools.count(EXTSAPDPID_BASE + 1)
+
+# time (seconds) for which docker inspect results of a container are reused
+INSPECT_CACHE_TTL = 1.0
+# time (seconds) for which network status of a container is reused
+NETWORK_STATUS_CACHE_TTL = 2.0
+
 
 class EmulatorCompute(Docker):
     """
@@ -46,63 +56,100 @@ class EmulatorCompute(Docker):
     We can add emulator specific helper functions to it.
     """
 
+    # emulator specific attributes (Docker itself still uses a __dict__)
+    __slots__ = ("datacenter", "flavor_name",
+                 "_network_state_cache", "_network_state_ts",
+                 "_inspect_cache", "_inspect_ts", "_status_template")
+
     def __init__(
             self, name, dimage, **kwargs):
         self.datacenter = kwargs.get("datacenter")  # pointer to current DC
         self.flavor_name = kwargs.get("flavor_name")
         self._network_state_cache = None
-        LOG.debug("Starting compute instance %r in data center %r" %
-                  (name, str(self.datacenter)))
+        self._network_state_ts = 0
+        self._inspect_cache = None
+        self._inspect_ts = 0
+        LOG.debug("Starting compute instance %r in data center %r",
+                  name, self.datacenter)
         # call original Docker.__init__
         Docker.__init__(self, name, dimage, **kwargs)
+        # status fields that do not change during the container's lifetime
+        # (resource limits are excluded: resource models update them later)
+        self._status_template = {
+            "name": self.name,
+            "docker_network": self.dcinfo['NetworkSettings']['IPAddress'],
+            "id": self.dcinfo["Id"],
+            "short_id": self.dcinfo["Id"][:12],
+            "hostname": self.dcinfo["Config"]['Hostname'],
+            "image": self.dimage,
+            "flavor_name": self.flavor_name,
+            "datacenter": (None if self.datacenter is None
+                           else self.datacenter.label)
+        }
 
-    def getNetworkStatus(self):
+    def _inspect(self, ttl=INSPECT_CACHE_TTL):
+        """
+        Inspect the container using the Docker API. Results are cached
+        for ttl seconds to avoid hitting the Docker daemon on every
+        status request.
+        """
+        now = time.time()
+        if self._inspect_cache is None or now - self._inspect_ts > ttl:
+            self._inspect_cache = self.dcli.inspect_container(self.dc)
+            self._inspect_ts = now
+        return self._inspect_cache
+
+    def invalidateNetworkStatusCache(self):
+        """
+        Drop cached network status, e.g., after links or
+        interface configurations have changed.
+        """
+        self._network_state_cache = None
+
+    def getNetworkStatus(self, ttl=NETWORK_STATUS_CACHE_TTL):
         """
         Helper method to receive information about the virtual networks
         this compute instance is connected to.
+        Results are cached for ttl seconds since querying the interfaces
+        is slow.
+        """
+        now = time.time()
+        if (self._network_state_cache is None or
+                now - self._network_state_ts > ttl):
+            self._network_state_cache = list(self.iterNetworkStatus())
+            self._network_state_ts = now
+        return self._network_state_cache
+
+    def iterNetworkStatus(self):
+        """
+        Generator variant of getNetworkStatus that yields the
+        information of one interface at a time (not cached).
         """
         # get all links and find dc switch interface
-        networkStatusList = []
         for i in self.intfList():
             vnf_name = self.name
             vnf_interface = str(i)
             dc_port_name = self.datacenter.net.find_connected_dc_interface(
                 vnf_name, vnf_interface)
             # format list of tuples (name, Ip, MAC, isUp, status, dc_portname)
-            intf_dict = {'intf_name': str(i), 'ip': "{0}/{1}".format(i.IP(), i.prefixLen), 'netmask': i.prefixLen,
-                         'mac': i.MAC(), 'up': i.isUp(), 'status': i.status(), 'dc_portname': dc_port_name}
-            networkStatusList.append(intf_dict)
-        return networkStatusList
+            yield {'intf_name': vnf_interface, 'ip': "{0}/{1}".format(i.IP(), i.prefixLen), 'netmask': i.prefixLen,
+                   'mac': i.MAC(), 'up': i.isUp(), 'status': i.status(), 'dc_portname': dc_port_name}
 
     def getStatus(self):
         """
         Helper method to receive information about this compute instance.
         """
-        # inspect container
-        cinspect = self.dcli.inspect_container(self.dc)
-        # inspect networking (slow, so do only once)
-        if self._network_state_cache is None:
-            self._network_state_cache = self.getNetworkStatus()
-        # build status
-        status = {}
-        status["name"] = self.name
-        status["network"] = self._network_state_cache
-        status["docker_network"] = self.dcinfo['NetworkSettings']['IPAddress']
-        status["image"] = self.dimage
-        status["flavor_name"] = self.flavor_name
+        # build status based on the static fields
+        status = self._status_template.copy()
+        status["network"] = self.getNetworkStatus()
         status["cpu_quota"] = self.resources.get('cpu_quota')
         status["cpu_period"] = self.resources.get('cpu_period')
         status["cpu_shares"] = self.resources.get('cpu_shares')
         status["cpuset"] = self.resources.get('cpuset_cpus')
         status["mem_limit"] = self.resources.get('mem_limit')
         status["memswap_limit"] = self.resources.get('memswap_limit')
-        status["state"] = cinspect["State"]
-        status["id"] = cinspect["Id"]
-        status["short_id"] = cinspect["Id"][:12]
-        status["hostname"] = cinspect["Config"]['Hostname']
-        status["datacenter"] = (None if self.datacenter is None
-                                else self.datacenter.label)
-
+        # only the state needs a fresh inspect (cached, see _inspect)
+        status["state"] = self._inspect()["State"]
         return status
 
 
@@ -121,22 +168,21 @@ class EmulatorExtSAP(object):
         self.net = self.datacenter.net
         self.name = sap_name
 
-        LOG.debug("Starting ext SAP instance %r in data center %r" %
-                  (sap_name, str(self.datacenter)))
+        LOG.debug("Starting ext SAP instance %r in data center %r",
+                  sap_name, self.datacenter)
 
         # create SAP as separate OVS switch with an assigned ip address
         self.ip = str(sap_net[1]) + '/' + str(sap_net.prefixlen)
         self.subnet = sap_net
         # allow connection to the external internet through the host
         params = dict(NAT=True)
-        self.switch = self.net.addExtSAP(sap_name, self.ip, dpid=hex(
-            self._get_next_extSAP_dpid())[2:], **params)
+        self.switch = self.net.addExtSAP(
+            sap_name, self.ip, dpid="%x" % self._get_next_extSAP_dpid(),
+            **params)
         self.switch.start()
 
     def _get_next_extSAP_dpid(self):
-        global EXTSAPDPID_BASE
-        EXTSAPDPID_BASE += 1
-        return EXTSAPDPID_BASE
+        return next(_EXTSAPDPID_ITER)
 
     def getNetworkStatus(self):
         """
@@ -175,6 +221,10 @@ class Datacenter(object):
     Will also implement resource bookkeeping in later versions.
     """
 
+    __slots__ = ("net", "name", "label", "metadata", "resource_log_path",
+                 "_resource_log", "switch", "containers", "extSAPs",
+                 "_resource_model", "_status_base")
+
     DC_COUNTER = 1
 
     def __init__(self, label, metadata={}, resource_log_path=None):
@@ -190,6 +240,8 @@ class Datacenter(object):
         # path to which resource information should be logged (e.g. for
         # experiments). None = no logging
         self.resource_log_path = resource_log_path
+        # file object of the resource log, opened on first use
+        self._resource_log = None
         # first prototype assumes one "bigswitch" per DC
         self.switch = None
         # keep track of running containers
@@ -198,14 +250,14 @@ class Datacenter(object):
         self.extSAPs = {}
         # pointer to assigned resource model
         self._resource_model = None
+        # static part of the status dict (set once the switch is created)
+        self._status_base = None
 
     def __repr__(self):
         return self.label
 
     def _get_next_dc_dpid(self):
-        global DCDPID_BASE
-        DCDPID_BASE += 1
-        return DCDPID_BASE
+        return next(_DCDPID_ITER)
 
     def create(self):
         """
@@ -216,12 +268,40 @@ class Datacenter(object):
         per data center
         """
         self.switch = self.net.addSwitch(
-            "%s.s1" % self.name, dpid=hex(self._get_next_dc_dpid())[2:])
-        LOG.debug("created data center switch: %s" % str(self.switch))
+            "%s.s1" % self.name, dpid="%x" % self._get_next_dc_dpid())
+        LOG.debug("created data center switch: %s", self.switch)
+        self._status_base = {
+            "label": self.label,
+            "internalname": self.name,
+            "switch": self.switch.name,
+            "metadata": self.metadata
+        }
 
     def start(self):
         pass
 
+    def stop(self):
+        """
+        Flush and close the resource log (if any).
+        """
+        if self._resource_log is not None:
+            self._resource_log.close()
+            self._resource_log = None
+
+    def _get_resource_log(self):
+        """
+        Return the opened resource log file or None if
+        resource logging is disabled. The file is kept open to
+        avoid re-opening it for each allocate/free event. It is line
+        buffered, so each entry is written completely right away
+        (even if multiple DCs log to the same file).
+        """
+        if self.resource_log_path is None:
+            return None
+        if self._resource_log is None:
+            self._resource_log = open(self.resource_log_path, "a", 1)
+        return self._resource_log
+
     def startCompute(self, name, image=None, command=None, network=None,
                      flavor_name="tiny", properties=dict(), **params):
         """
@@ -235,11 +315,17 @@ class Datacenter(object):
         :param properties: dictionary of properties (key-value) that will be passed as environment variables
         :return:
         """
-        assert name is not None
+        if name is None:
+            raise ValueError("Container name is required.")
+        # avoid repeated attribute lookups when creating many containers
+        net = self.net
         default_net = {"id": "emu0"}
-        # no duplications
-        if name in [c.name for c in self.net.getAllContainers()]:
-            raise Exception("Container with name %s already exists." % name)
+        # no duplications (reserve the name until the container is set up)
+        with net.container_lock:
+            if name in net.container_index:
+                raise Exception(
+                    "Container with name %s already exists." % name)
+            net.container_index[name] = None
         # set default parameter
         if image is None:
             image = "ubuntu:trusty"
@@ -259,79 +345,142 @@ class Datacenter(object):
         # apply hard-set resource limits=0
         cpu_percentage = params.get('cpu_percent')
         if cpu_percentage:
-            params['cpu_period'] = self.net.cpu_period
-            params['cpu_quota'] = self.net.cpu_period * float(cpu_percentage)
-
-        env = properties
-        properties['VNF_NAME'] = name
-        # create the container
-        d = self.net.addDocker(
-            str(name),
-            dimage=image,
-            dcmd=command,
-            datacenter=self,
-            flavor_name=flavor_name,
-            environment=env,
-            **params
-        )
-
-        # apply resource limits to container if a resource model is defined
-        if self._resource_model is not None:
+            params['cpu_period'] = net.cpu_period
+            params['cpu_quota'] = net.cpu_period * float(cpu_percentage)
+
+        # copy to not modify the (shared) properties of the caller
+        env = dict(properties)
+        env['VNF_NAME'] = name
+        # create the container (not locked: Docker API calls can overlap)
+        try:
+            d = net.addDocker(
+                name,
+                dimage=image,
+                dcmd=command,
+                datacenter=self,
+                flavor_name=flavor_name,
+                environment=env,
+                **params
+            )
+        except BaseException:
+            with net.container_lock:
+                del net.container_index[name]
+            raise
+
+        with net.container_lock:
+            allocated = False
             try:
-                self._resource_model.allocate(d)
-                self._resource_model.write_allocation_log(
-                    d, self.resource_log_path)
-            except NotEnoughResourcesAvailable as ex:
-                LOG.warning(
-                    "Allocation of container %r was blocked by resource model." % name)
-                LOG.info(ex.message)
-                # ensure that we remove the container
-                self.net.removeDocker(name)
-                return None
-
-        # connect all given networks
-        # if no --net option is given, network = [{}], so 1 empty dict in the list
-        # this results in 1 default interface with a default ip address
-        for nw in network:
-            # clean up network configuration (e.g. RTNETLINK does not allow ':'
-            # in intf names
-            if nw.get("id") is not None:
-                nw["id"] = self._clean_ifname(nw["id"])
-            # TODO we cannot use TCLink here (see:
-            # https://github.com/mpeuster/containernet/issues/3)
-            self.net.addLink(d, self.switch, params1=nw,
-                             cls=Link, intfName1=nw.get('id'))
-        # do bookkeeping
-        self.containers[name] = d
+                # apply resource limits to container if a resource model is
+                # defined
+                if self._resource_model is not None:
+                    try:
+                        self._resource_model.allocate(d)
+                        allocated = True
+                        self._resource_model.write_allocation_log(
+                            d, self._get_resource_log())
+                    except NotEnoughResourcesAvailable as ex:
+                        LOG.warning(
+                            "Allocation of container %r was blocked by resource model.", name)
+                        LOG.info("%s", ex)
+                        # ensure that we remove the container
+                        net.removeDocker(name)
+                        del net.container_index[name]
+                        return None
+
+                # connect all given networks
+                # if no --net option is given, network = [{}], so 1 empty dict in the list
+                # this results in 1 default interface with a default ip address
+                addLink = net.addLink
+                for nw in network:
+                    # clean up network configuration (e.g. RTNETLINK does
+                    # not allow ':' in intf names
+                    if nw.get("id") is not None:
+                        nw["id"] = self._clean_ifname(nw["id"])
+                    # TODO we cannot use TCLink here (see:
+                    # https://github.com/mpeuster/containernet/issues/3)
+                    addLink(d, self.switch, params1=nw,
+                            cls=Link, intfName1=nw.get('id'))
+            except BaseException:
+                # roll back the partially started container and release
+                # its name
+                LOG.warning("Setup of container %r failed. Removing it.",
+                            name)
+                if allocated:
+                    self._resource_model.free(d)
+                for link in net.linksBetween(d, self.switch):
+                    net.removeLink(link=link)
+                net.removeDocker(name)
+                del net.container_index[name]
+                raise
+            # do bookkeeping
+            self.containers[name] = d
+            net.container_index[name] = d
         return d  # we might use UUIDs for naming later on
 
+    def startComputeMany(self, specs, max_workers=8):
+        """
+        Create multiple compute instances in this data center in parallel.
+        Container creation (Docker API calls) is overlapped, the network
+        setup of each instance is still done one after another.
+        :param specs: list of dicts with startCompute arguments, e.g.,
+        [{"name": "vnf1", "image": "ubuntu:trusty"}, {"name": "vnf2"}]
+        :param max_workers: max. number of containers created at once
+        :return: list of created containers (same order as specs), entries
+        are None if the resource model blocked the allocation (like
+        startCompute). If any instance fails to start, all instances
+        started by this call are stopped again and the first exception
+        is re-raised.
+        """
+        def start(spec):
+            try:
+                return self.startCompute(**spec), None
+            except Exception as ex:
+                return None, ex
+
+        # ThreadPool (unlike concurrent.futures) is available on Python 2
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(processes=max_workers)
+        try:
+            results = pool.map(start, specs)
+        finally:
+            pool.close()
+            pool.join()
+        errors = [ex for _, ex in results if ex is not None]
+        if errors:
+            # do not leave a partially started batch behind
+            for d, _ in results:
+                if d is not None:
+                    self.stopCompute(d.name)
+            raise errors[0]
+        return [d for d, _ in results]
+
     def stopCompute(self, name):
         """
         Stop and remove a container from this data center.
         """
-        assert name is not None
-        if name not in self.containers:
-            raise Exception("Container with name %s not found." % name)
-        LOG.debug("Stopping compute instance %r in data center %r" %
-                  (name, str(self)))
-
-        #  stop the monitored metrics
-        if self.net.monitor_agent is not None:
-            self.net.monitor_agent.stop_metric(name)
-
-        # call resource model and free resources
-        if self._resource_model is not None:
-            self._resource_model.free(self.containers[name])
-            self._resource_model.write_free_log(
-                self.containers[name], self.resource_log_path)
-
-        # remove links
-        self.net.removeLink(
-            link=None, node1=self.containers[name], node2=self.switch)
-
-        # remove container
-        self.net.removeDocker("%s" % (name))
-        del self.containers[name]
+        if name is None:
+            raise ValueError("Container name is required.")
+        # serialize with concurrent start/stop calls (see startComputeMany)
+        with self.net.container_lock:
+            if name not in self.containers:
+                raise Exception("Container with name %s not found." % name)
+            LOG.debug("Stopping compute instance %r in data center %r",
+                      name, self)
+
+            #  stop the monitored metrics
+            if self.net.monitor_agent is not None:
+                self.net.monitor_agent.stop_metric(name)
+
+            # call resource model and free resources
+            if self._resource_model is not None:
+                self._resource_model.free(self.containers[name])
+                self._resource_model.write_free_log(
+                    self.containers[name], self._get_resource_log())
+
+            # remove container and its links
+            self.net.removeCompute(self.containers[name], self.switch)
+            del self.containers[name]
+            del self.net.container_index[name]
 
         return True
 
@@ -350,9 +499,20 @@ class Datacenter(object):
         del self.extSAPs[sap_name]
 
     def listCompute(self):
+        """
+        Return a view of all running containers assigned to this
+        data center. The view is not thread-safe: iterating it while
+        containers are started or stopped by other threads (e.g. API
+        endpoints) raises a RuntimeError. Use listComputeSnapshot in
+        this case, e.g., if each container is queried during iteration.
+        """
+        return self.containers.values()
+
+    def listComputeSnapshot(self):
         """
         Return a list of all running containers assigned to this
-        data center.
+        data center. Unlike listCompute, the result does not change
+        if containers are added or removed later on.
         """
         return list(self.containers.values())
 
@@ -367,17 +527,11 @@ class Datacenter(object):
         """
         Return a dict with status information about this DC.
         """
-        container_list = [name for name in self.containers]
-        ext_saplist = [sap_name for sap_name in self.extSAPs]
-        return {
-            "label": self.label,
-            "internalname": self.name,
-            "switch": self.switch.name,
-            "n_running_containers": len(self.containers),
-            "metadata": self.metadata,
-            "vnf_list": container_list,
-            "ext SAP list": ext_saplist
-        }
+        status = self._status_base.copy()
+        status["n_running_containers"] = len(self.containers)
+        status["vnf_list"] = list(self.containers)
+        status["ext SAP list"] = list(self.extSAPs)
+        return status
 
     def assignResourceModel(self, rm):
         """
@@ -390,7 +544,7 @@ class Datacenter(object):
                 "There is already an resource model assigned to this DC.")
         self._resource_model = rm
         self.net.rm_registrar.register(self, rm)
-        LOG.info("Assigned RM: %r to DC: %r" % (rm, self))
+        LOG.info("Assigned RM: %r to DC: %r", rm, self)
 
     @staticmethod
     def _clean_ifname(name):
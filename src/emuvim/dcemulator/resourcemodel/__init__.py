@@ -156,29 +156,29 @@ class BaseResourceModel(object):
         """
         return dict()
 
-    def write_allocation_log(self, d, path):
+    def write_allocation_log(self, d, log_file):
         """
         Helper to log RM info for experiments.
         :param d: container
-        :param path: log path
+        :param log_file: opened log file (None = no logging)
         :return:
         """
-        self._write_log(d, path, "allocate")
+        self._write_log(d, log_file, "allocate")
 
-    def write_free_log(self, d, path):
+    def write_free_log(self, d, log_file):
         """
         Helper to log RM info for experiments.
         :param d: container
-        :param path: log path
+        :param log_file: opened log file (None = no logging)
         :return:
         """
-        self._write_log(d, path, "free")
+        self._write_log(d, log_file, "free")
 
-    def _write_log(self, d, path, action):
+    def _write_log(self, d, log_file, action):
         """
         Helper to log RM info for experiments.
         :param d: container
-        :param path: log path
+        :param log_file: opened log file (None = no logging)
         :param action: allocate or free
         :return:
         """
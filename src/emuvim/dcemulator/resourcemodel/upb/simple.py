@@ -23,8 +23,6 @@
 # the Horizon 2020 and 5G-PPP programmes. The authors would like to
 # acknowledge the contributions of their colleagues of the SONATA
 # partner consortium (www.sonata-nfv.eu).
-import time
-import json
 import logging
 from emuvim.dcemulator.resourcemodel import BaseResourceModel, NotEnoughResourcesAvailable
 
@@ -33,6 +31,30 @@ LOG.setLevel(logging.DEBUG)
 
 CPU_PERIOD = 1000000
 
+# JSON serializer for resource logs, selected on first use
+_json_dumps = None
+
+
+def _get_json_dumps():
+    """
+    Return a function that serializes resource log entries.
+    Uses orjson if available and the json module otherwise. Imported
+    lazily since it is only needed if resource logging is enabled.
+    """
+    global _json_dumps
+    if _json_dumps is None:
+        try:
+            import orjson
+
+            def _json_dumps(o):
+                return orjson.dumps(o).decode()
+        except ImportError:
+            import json
+
+            def _json_dumps(o):
+                return json.dumps(o, separators=(",", ":"))
+    return _json_dumps
+
 
 class UpbSimpleCloudDcRM(BaseResourceModel):
     """
@@ -239,13 +261,13 @@ class UpbSimpleCloudDcRM(BaseResourceModel):
         """
         # collect info about all allocated instances
         allocation_state = dict()
-        for k, d in self._allocated_compute_instances.iteritems():
+        for k, d in self._allocated_compute_instances.items():
             s = dict()
-            s["cpu_period"] = d.cpu_period
-            s["cpu_quota"] = d.cpu_quota
-            s["cpu_shares"] = d.cpu_shares
-            s["mem_limit"] = d.mem_limit
-            s["memswap_limit"] = d.memswap_limit
+            s["cpu_period"] = d.resources.get('cpu_period')
+            s["cpu_quota"] = d.resources.get('cpu_quota')
+            s["cpu_shares"] = d.resources.get('cpu_shares')
+            s["mem_limit"] = d.resources.get('mem_limit')
+            s["memswap_limit"] = d.resources.get('memswap_limit')
             allocation_state[k] = s
         # final result
         r = dict()
@@ -273,25 +295,26 @@ class UpbSimpleCloudDcRM(BaseResourceModel):
             raise Exception("Flavor %r does not exist" % d.flavor_name)
         return self._flavors.get(d.flavor_name)
 
-    def _write_log(self, d, path, action):
+    def _write_log(self, d, log_file, action):
         """
         Helper to log RM info for experiments.
         :param d: container
-        :param path: log path
+        :param log_file: opened log file (None = no logging)
         :param action: allocate or free
         :return:
         """
-        if path is None:
+        if log_file is None:
             return
-        # we have a path: write out RM info
+        # only needed if logging is enabled, so import lazily
+        import time
+        # we have a log file: write out RM info
         logd = dict()
         logd["t"] = time.time()
         logd["container_state"] = d.getStatus()
         logd["action"] = action
         logd["rm_state"] = self.get_state_dict()
-        # append to logfile
-        with open(path, "a") as f:
-            f.write("%s\n" % json.dumps(logd))
+        # append to logfile (line buffered, flushed after each entry)
+        log_file.write(_get_json_dumps()(logd) + "\n")
 
 
 class UpbOverprovisioningCloudDcRM(UpbSimpleCloudDcRM):
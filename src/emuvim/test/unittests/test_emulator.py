@@ -310,8 +310,8 @@ class testEmulatorCompute(SimpleTestTopology):
         # check compute list result
         self.assertTrue(len(self.dc[0].listCompute()) == 1)
         self.assertTrue(isinstance(
-            self.dc[0].listCompute()[0], EmulatorCompute))
-        self.assertTrue(self.dc[0].listCompute()[0].name == "vnf1")
+            self.dc[0].listComputeSnapshot()[0], EmulatorCompute))
+        self.assertTrue(self.dc[0].listComputeSnapshot()[0].name == "vnf1")
         # check connectivity by using ping
         self.assertTrue(self.net.ping([self.h[0], vnf1]) <= 0.0)
         # stop Mininet network
@@ -338,6 +338,9 @@ class testEmulatorCompute(SimpleTestTopology):
         self.assertTrue(len(self.dc[0].listCompute()) == 1)
         # check connectivity by using ping
         self.assertTrue(self.net.ping([self.h[0], vnf1]) <= 0.0)
+        # invalid names are rejected
+        self.assertRaises(ValueError, self.dc[0].startCompute, None)
+        self.assertRaises(ValueError, self.dc[0].stopCompute, None)
         # remove compute resources
         self.dc[0].stopCompute("vnf1")
         # check number of running nodes
@@ -349,6 +352,29 @@ class testEmulatorCompute(SimpleTestTopology):
         # stop Mininet network
         self.stopNet()
 
+    def testRemoveMultiNetworkComputeSingleDC(self):
+        """
+        Test that stopping a compute instance with multiple
+        networks removes all of its links.
+        """
+        # create network
+        self.createNet(nswitches=0, ndatacenter=1, nhosts=0, ndockers=0)
+        # start Mininet network
+        self.startNet()
+        # add compute resources with two networks
+        vnf1 = self.dc[0].startCompute(
+            "vnf1", network=[{"id": "intf1"}, {"id": "intf2"}])
+        self.assertTrue(len(self.net.linksBetween(
+            vnf1, self.dc[0].switch)) == 2)
+        # remove compute resources
+        self.dc[0].stopCompute("vnf1")
+        # check that no link to vnf1 is left
+        self.assertFalse(
+            [link for link in self.net.links
+             if vnf1 in (link.intf1.node, link.intf2.node)])
+        # stop Mininet network
+        self.stopNet()
+
     def testGetStatusSingleComputeSingleDC(self):
         """
         Check if the getStatus functionality of EmulatorCompute
@@ -369,8 +395,8 @@ class testEmulatorCompute(SimpleTestTopology):
         # check compute list result
         self.assertTrue(len(self.dc[0].listCompute()) == 1)
         self.assertTrue(isinstance(
-            self.dc[0].listCompute()[0], EmulatorCompute))
-        self.assertTrue(self.dc[0].listCompute()[0].name == "vnf1")
+            self.dc[0].listComputeSnapshot()[0], EmulatorCompute))
+        self.assertTrue(self.dc[0].listComputeSnapshot()[0].name == "vnf1")
         # check connectivity by using ping
         self.assertTrue(self.net.ping([self.h[0], vnf1]) <= 0.0)
         # check get status
@@ -380,6 +406,30 @@ class testEmulatorCompute(SimpleTestTopology):
         # stop Mininet network
         self.stopNet()
 
+    def testNetworkStatusAfterLinkChangeSingleDC(self):
+        """
+        Check that the (cached) network status of a compute
+        instance reflects added and removed links immediately.
+        """
+        # create network
+        self.createNet(nswitches=0, ndatacenter=1, nhosts=0, ndockers=0)
+        # start Mininet network
+        self.startNet()
+        # add compute resources
+        vnf1 = self.dc[0].startCompute("vnf1")
+        # populate the cache
+        self.assertTrue(len(vnf1.getNetworkStatus()) == 1)
+        # add second interface and check that it is reported
+        self.net.addLink(vnf1, self.dc[0], intfName1="intf2")
+        ns = vnf1.getNetworkStatus()
+        self.assertTrue(len(ns) == 2)
+        self.assertIn("intf2", [intf["intf_name"] for intf in ns])
+        # remove one link again
+        self.net.removeLink(node1=vnf1, node2=self.dc[0].switch)
+        self.assertTrue(len(vnf1.getNetworkStatus()) == 1)
+        # stop Mininet network
+        self.stopNet()
+
     def testConnectivityMultiDC(self):
         """
         Test if compute instances started in different data centers
@@ -462,6 +512,72 @@ class testEmulatorCompute(SimpleTestTopology):
         # stop Mininet network
         self.stopNet()
 
+    def testDuplicateComputeNameMultiDC(self):
+        """
+        Ensure that compute instance names are unique across
+        all data centers and can be reused after removal.
+        """
+        # create network
+        self.createNet(nswitches=0, ndatacenter=2, nhosts=0, ndockers=0)
+        # start Mininet network
+        self.startNet()
+        # add compute resources
+        self.dc[0].startCompute("vnf1")
+        # same name in same and in other DC must fail
+        self.assertRaises(Exception, self.dc[0].startCompute, "vnf1")
+        self.assertRaises(Exception, self.dc[1].startCompute, "vnf1")
+        # name can be reused once the instance was removed
+        self.dc[0].stopCompute("vnf1")
+        self.dc[1].startCompute("vnf1")
+        self.assertTrue(len(self.dc[0].listCompute()) == 0)
+        self.assertTrue(len(self.dc[1].listCompute()) == 1)
+        # stop Mininet network
+        self.stopNet()
+
+    def testAddMultipleComputeParallelSingleDC(self):
+        """
+        Start multiple compute instances in parallel and
+        check that all of them are reachable.
+        """
+        # create network
+        self.createNet(nswitches=0, ndatacenter=1, nhosts=1, ndockers=0)
+        # setup links
+        self.net.addLink(self.dc[0], self.h[0])
+        # start Mininet network
+        self.startNet()
+        # add compute resources
+        vnfs = self.dc[0].startComputeMany(
+            [{"name": "vnf%d" % i} for i in range(4)], max_workers=4)
+        self.assertEqual([v.name for v in vnfs],
+                         ["vnf0", "vnf1", "vnf2", "vnf3"])
+        # check number of running nodes
+        self.assertTrue(len(self.getContainernetContainers()) == 4)
+        self.assertTrue(len(self.dc[0].listCompute()) == 4)
+        self.assertTrue(len(self.net.getAllContainers()) == 4)
+        # check connectivity by using ping
+        self.assertTrue(self.net.ping([self.h[0]] + vnfs) <= 0.0)
+        # stop Mininet network
+        self.stopNet()
+
+    def testAddMultipleComputeParallelFailureSingleDC(self):
+        """
+        Ensure that a failing parallel start does not leave
+        any of the other instances running.
+        """
+        # create network
+        self.createNet(nswitches=0, ndatacenter=1, nhosts=0, ndockers=0)
+        # start Mininet network
+        self.startNet()
+        # duplicated name: one of the two starts has to fail
+        self.assertRaises(Exception, self.dc[0].startComputeMany,
+                          [{"name": "vnf1"}, {"name": "vnf1"}])
+        # check that everything was cleaned up
+        self.assertTrue(len(self.getContainernetContainers()) == 0)
+        self.assertTrue(len(self.dc[0].listCompute()) == 0)
+        self.assertTrue(len(self.net.getAllContainers()) == 0)
+        # stop Mininet network
+        self.stopNet()
+
 
 if __name__ == '__main__':
     unittest.main()
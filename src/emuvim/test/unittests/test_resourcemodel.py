@@ -25,6 +25,8 @@
 # partner consortium (www.sonata-nfv.eu).
 import time
 import os
+import json
+import tempfile
 import unittest
 from emuvim.test.base import SimpleTestTopology
 from emuvim.dcemulator.resourcemodel import BaseResourceModel, ResourceFlavor, NotEnoughResourcesAvailable, ResourceModelRegistrar
@@ -111,6 +113,9 @@ def createDummyContainerObject(name, flavor):
         def updateMemoryLimit(self, mem_limit):
             self.resources['mem_limit'] = mem_limit
 
+        def getStatus(self):
+            return {"name": self.name}
+
     d = DummyContainer()
     d.name = name
     d.flavor_name = flavor
@@ -261,6 +266,35 @@ class testUpbSimpleCloudDcRM(SimpleTestTopology):
         rm.free(c1)
         self.assertTrue(rm.dc_alloc_cu == 0)
 
+    def testWriteLog(self):
+        """
+        Test the allocation and free log entries.
+        :return:
+        """
+        # create dummy resource model environment
+        reg = ResourceModelRegistrar(
+            dc_emulation_max_cpu=1.0, dc_emulation_max_mem=512)
+        rm = UpbSimpleCloudDcRM(max_cu=100, max_mu=100)
+        reg.register("test_dc", rm)
+        c1 = createDummyContainerObject("c7", flavor="tiny")
+        log_file = tempfile.TemporaryFile(mode="w+")
+        # no log file: nothing is written
+        rm.allocate(c1)
+        rm.write_allocation_log(c1, None)
+        rm.write_allocation_log(c1, log_file)
+        rm.free(c1)
+        rm.write_free_log(c1, log_file)
+        # check that we have one valid JSON entry per line
+        log_file.seek(0)
+        entries = [json.loads(line) for line in log_file.readlines()]
+        log_file.close()
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0]["action"], "allocate")
+        self.assertEqual(entries[0]["container_state"]["name"], "c7")
+        self.assertIn("c7", entries[0]["rm_state"]["allocation_state"])
+        self.assertEqual(entries[1]["action"], "free")
+        self.assertEqual(entries[1]["rm_state"]["allocation_state"], {})
+
     @unittest.skipIf(os.environ.get("SON_EMU_IN_DOCKER") is not None,
                      "skipping test when running inside Docker container")
     def testInRealTopo(self):
@@ -74,11 +74,11 @@ class testRestApi(SimpleTestTopology):
         self.assertEqual(len(self.dc[0].listCompute()), 2)
         self.assertEqual(len(self.dc[1].listCompute()), 1)
         self.assertTrue(isinstance(
-            self.dc[0].listCompute()[0], EmulatorCompute))
+            self.dc[0].listComputeSnapshot()[0], EmulatorCompute))
         self.assertTrue(isinstance(
-            self.dc[0].listCompute()[1], EmulatorCompute))
+            self.dc[0].listComputeSnapshot()[1], EmulatorCompute))
         self.assertTrue(isinstance(
-            self.dc[1].listCompute()[0], EmulatorCompute))
+            self.dc[1].listComputeSnapshot()[0], EmulatorCompute))
         print("dc1: ", self.dc[0].listCompute())
         print("dc2: ", self.dc[1].listCompute())
         self.assertIn("vnf1", list(map(lambda x: x.name, self.dc[0].listCompute())))
@@ -87,11 +87,11 @@ class testRestApi(SimpleTestTopology):
 
         # check connectivity by using ping
         self.assertTrue(self.net.ping(
-            [self.dc[0].listCompute()[1], self.dc[0].listCompute()[0]]) <= 0.0)
+            [self.dc[0].listComputeSnapshot()[1], self.dc[0].listComputeSnapshot()[0]]) <= 0.0)
         self.assertTrue(self.net.ping(
-            [self.dc[0].listCompute()[0], self.dc[1].listCompute()[0]]) <= 0.0)
+            [self.dc[0].listComputeSnapshot()[0], self.dc[1].listComputeSnapshot()[0]]) <= 0.0)
         self.assertTrue(self.net.ping(
-            [self.dc[1].listCompute()[0], self.dc[0].listCompute()[1]]) <= 0.0)
+            [self.dc[1].listComputeSnapshot()[0], self.dc[0].listComputeSnapshot()[1]]) <= 0.0)
 
         print('network add vnf1 vnf2->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>')
         print('->>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>')